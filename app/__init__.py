@@ -11,12 +11,16 @@ basta importar o módulo `config` e acessar o atributo `settings`.
 
 import logging
 import logging.config
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.cors import CORSMiddleware
 
 from app.config import get_api_settings 
-from app.db.db_session import initialize_database
+from app.db.db_session import get_async_engine, initialize_database
 from app.routes import api_router_v1
 
 logging.config.fileConfig("logging.conf", disable_existing_loggers=False)
@@ -24,27 +28,46 @@ logging.config.fileConfig("logging.conf", disable_existing_loggers=False)
 logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Ciclo de vida do app.
+    Cria o engine do banco na inicialização, guardando em `app.state.engine`
+    para ser compartilhado pelas sessões, e libera as conexões no encerramento.
+    """
+    app.state.engine = get_async_engine()
+    await initialize_database(app.state.engine)
+
+    yield
+
+    await app.state.engine.dispose()
+
+
 def create_app() -> FastAPI:
     """
     Cria o app FastAPI e adiciona os middlewares e rotas.
 
     """
     app = FastAPI(
-        title=get_api_settings().service_name, docs_url="/api/docs", redoc_url="/api/redoc"
+        title=get_api_settings().service_name,
+        docs_url="/api/docs",
+        redoc_url="/api/redoc",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
 
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],
+        allow_origins=get_api_settings().allowed_origins,
         allow_credentials=True,
         allow_methods=["*"],
-        allow_headers=["*"],
+        allow_headers=["Content-Type", "token"],
     )
 
     app.include_router(api_router_v1, prefix="/api")
 
-    app.on_event("startup")(initialize_database)
-
     logger.info(f"starting app {get_api_settings().service_name}")
 
     return app
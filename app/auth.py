@@ -5,17 +5,50 @@ Esse modulo foi construido em separa, para facilitar a reutilização
  em outras partes do projetos,
 alem de ficar mais organizado e visivel, facilitando a manutenção.
 """
+import hashlib
 import logging
+import time
 from datetime import datetime, timedelta
+from threading import Lock
 
+import jwt
+from cachetools import TTLCache
 from fastapi import Header, HTTPException, status
-from jose import ExpiredSignatureError, JWTError, jwt
 from pydantic import BaseModel
 
-from app.config import get_api_settings
+from app.config import get_api_settings, reload_api_settings
 
 logger = logging.getLogger(__name__)
 
+# Chave e algoritmo do token, lidos uma única vez na importação do módulo.
+_SECRET_KEY: str = get_api_settings().secret_key
+_ALGORITHM: str = get_api_settings().algorithm
+
+# Cache de tokens já validados, indexado pelo SHA-256 do token.
+# O acesso é protegido por lock, pois dependências síncronas rodam no threadpool.
+_token_cache: TTLCache = TTLCache(
+    maxsize=get_api_settings().token_cache_size, ttl=get_api_settings().token_cache_ttl
+)
+_token_cache_lock = Lock()
+
+
+def reload_auth_settings() -> None:
+    """
+    Recarrega a chave e o algoritmo do token a partir das configurações.
+
+    As configurações são relidas do ambiente com `reload_api_settings`, permitindo
+    alterar as variáveis de ambiente durante os testes. Os tokens em cache também são
+    descartados, pois foram validados com a configuração anterior.
+    """
+    global _SECRET_KEY, _ALGORITHM
+
+    settings = reload_api_settings()
+    _SECRET_KEY = settings.secret_key
+    _ALGORITHM = settings.algorithm
+
+    with _token_cache_lock:
+        _token_cache.clear()
+
 
 class Token(BaseModel):
     access_token: str
@@ -26,11 +59,16 @@ class Auth(BaseModel):
     username: str
 
 
+# Argumentos constantes das exceções de autenticação. A exceção em si é criada
+# a cada chamada, para não compartilhar traceback e contexto entre requisições.
+_CREDENTIALS_HEADERS = {"token": "Bearer"}
+
+
 def raise_exception():
     raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
-        headers={"token": "Bearer"},
+        headers=_CREDENTIALS_HEADERS,
     )
 
 
@@ -68,12 +106,34 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None):
     else:
         expire = datetime.utcnow() + timedelta(minutes=15)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
-        to_encode, get_api_settings().secret_key, algorithm=get_api_settings().algorithm
-    )
+    encoded_jwt = jwt.encode(to_encode, _SECRET_KEY, algorithm=_ALGORITHM)
     return encoded_jwt
 
 
+def _verify_cached(token: str) -> dict:
+    """
+    Decodifica o token, reaproveitando o resultado de validações recentes.
+
+    O payload fica em cache junto com o `exp` do token, então um token expirado
+    nunca é servido do cache. Tokens inválidos não são armazenados e sempre
+    passam pela validação completa.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+
+    if cached is not None:
+        payload, exp = cached
+        if exp > time.time():
+            return payload
+
+    payload = jwt.decode(token, _SECRET_KEY, algorithms=[_ALGORITHM])
+    with _token_cache_lock:
+        _token_cache[key] = (payload, payload.get("exp", float("inf")))
+
+    return payload
+
+
 def get_current_username(token: str = Header()):
     """
     Verifica a validade de um token de acesso.
@@ -99,16 +159,14 @@ def get_current_username(token: str = Header()):
     """
     payload: dict = {}
     try:
-        payload = jwt.decode(
-            token, get_api_settings().secret_key, algorithms=[get_api_settings().algorithm]
-        )
-    except ExpiredSignatureError:
+        payload = _verify_cached(token)
+    except jwt.ExpiredSignatureError:
         raise_expired_token()
-    except JWTError:
+    except jwt.InvalidTokenError:
         raise_exception()
 
     username = payload.get("sub", None)
-    if username is None or {}:
+    if not username:
         raise_exception()
 
     return username
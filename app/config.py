@@ -10,15 +10,26 @@ Attributes:
 
     database_url: Define a url do banco de dados,
     por padrão é sqlite:///db.db, caso a variavel `is_sqlite` seja True .
+    db_pool_size: Define quantas conexões persistentes o pool mantém, por padrão é 20.
+    db_max_overflow: Define quantas conexões extras o pool pode abrir, por padrão é 10.
+    db_pool_timeout: Define quantos segundos esperar por uma conexão livre, por padrão é 30.
+    db_pool_recycle: Define após quantos segundos uma conexão é reciclada, por padrão é 1800.
+    use_pgbouncer: Define se o banco é acessado via PgBouncer em modo transaction (USE_PGBOUNCER),
+    desativando o pool local e o cache de prepared statements, por padrão é False.
+    O PgBouncer deve ser configurado com `server_reset_query = DISCARD ALL`.
 
     secret_key: Define a chave secreta para geração do token, por padrão é secret.
     algorithm: Define o algoritmo de geração do token, por padrão é HS256.
     token_expire: Define o tempo de expiração do token, por padrão é 30 minutos.
+    token_cache_size: Define quantos tokens validados ficam em cache, por padrão é 10000.
+    token_cache_ttl: Define por quantos segundos um token validado fica em cache, por padrão é 5.
+    cors_origins: Define as origens permitidas pelo CORS, separadas por vírgula,
+    por padrão é http://localhost:3000.
 
 """
 import logging
 import os
-from functools import lru_cache
+from functools import cached_property
 from typing import Any
 
 from dotenv import load_dotenv
@@ -49,6 +60,9 @@ class APISettings(BaseSettings):
     secret_key: str = getenv("SECRET_KEY", "secret")
     algorithm: str = getenv("ALGORITHM", "HS256")
     token_expire: int = int(getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
+    token_cache_size: int = int(getenv("TOKEN_CACHE_SIZE", 10_000))
+    token_cache_ttl: int = int(getenv("TOKEN_CACHE_TTL", 5))
+    cors_origins: str = getenv("CORS_ORIGINS", "http://localhost:3000")
 
     # database settings
     postgres_driver: str = "asyncpg"
@@ -57,27 +71,48 @@ class APISettings(BaseSettings):
     postgres_server: str = getenv("POSTGRES_SERVER")
     postgres_port: int = int(getenv("POSTGRES_PORT", 5432))
     postgres_db: str = getenv("POSTGRES_DB")
+    db_pool_size: int = int(getenv("DB_POOL_SIZE", 20))
+    db_max_overflow: int = int(getenv("DB_MAX_OVERFLOW", 10))
+    db_pool_timeout: int = int(getenv("DB_POOL_TIMEOUT", 30))
+    db_pool_recycle: int = int(getenv("DB_POOL_RECYCLE", 1800))
+    use_pgbouncer: bool = getenv("USE_PGBOUNCER", "false").lower() in ("1", "true")
 
-    @property
+    @cached_property
     def database_url(self) -> str:
-        """Create a valid Postgres database url."""
+        """Create a valid Postgres database url, built once per instance."""
         return f"postgresql+{self.postgres_driver}://"\
         f"{self.postgres_user}:{self.postgres_password}@"\
         f"{self.postgres_server}:{self.postgres_port}/{self.postgres_db}"
 
+    @cached_property
+    def allowed_origins(self) -> list[str]:
+        """List the CORS origins configured in `cors_origins`."""
+        return [origin.strip() for origin in self.cors_origins.split(",") if origin.strip()]
+
 
     class Config:
         validate_assignment = True
 
 
-@lru_cache()
+_settings = APISettings()
+
+
 def get_api_settings() -> APISettings:
     """
-    This function returns a cached instance of the APISettings object.
+    This function returns the module-level instance of the APISettings object.
 
-    Caching is used to prevent re-reading the environment every time the API settings are used in an endpoint.
+    The instance is created once at import, to prevent re-reading the environment every time
+    the API settings are used in an endpoint.
 
-    If you want to change an environment variable and reset the cache (e.g., during testing), this can be done
-    using the `lru_cache` instance method `get_api_settings.cache_clear()`.
+    If you want to change an environment variable and reload the settings (e.g., during testing),
+    use `reload_api_settings()`.
     """
-    return APISettings()
+    return _settings
+
+
+def reload_api_settings() -> APISettings:
+    """Re-read the environment and replace the module-level APISettings instance."""
+    global _settings
+
+    _settings = APISettings()
+    return _settings
@@ -1,18 +1,21 @@
 """Abstract CRUD Repo definitions."""
 import logging
-from typing import Generic, List, TypeVar
+from typing import AsyncIterator, Generic, List, Sequence, TypeVar
 
 from pydantic import BaseModel
 
-from sqlalchemy import select
+from sqlalchemy import delete, lambda_stmt, select, update
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.exceptions.crud_error import CRUDBaseError, CRUDSelectError, CRUDUpdateError
-
-from models import Base
+from app.db.db_session import metadata
+from app.exceptions.crud_error import CRUDBaseError, CRUDUpdateError
 
 
 logger = logging.getLogger(__name__)
 
+Base = declarative_base(metadata=metadata)
+
 ## ===== Custom Type Hints ===== ##
 # sqlalchemy models
 ModelType = TypeVar("ModelType", bound=Base)
@@ -23,6 +26,17 @@ UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 ReadOptionalSchemaType = TypeVar("ReadOptionalSchemaType", bound=BaseModel)
 
 
+def _where_equals(stmt: StatementLambdaElement, column, value) -> StatementLambdaElement:
+    """Add a `column == value` criteria to a lambda statement, as `filter_by` does.
+
+    Each criteria is built in its own scope, so the lambda closes over its own
+    column and value, and None gets a separate lambda to render `IS NULL`.
+    """
+    if value is None:
+        return stmt + (lambda s: s.where(column.is_(None)))
+    return stmt + (lambda s: s.where(column == value))
+
+
 ## ===== CRUD Repo ===== ##
 class SQLAlchemyRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, ReadOptionalSchemaType]):
     """Abstract SQLAlchemy repo defining basic database operations.
@@ -82,6 +96,23 @@ class SQLAlchemyRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType
         return res
 
 
+    def _optional_stmt(
+        self,
+        query_schema: ReadOptionalSchemaType,
+    ) -> StatementLambdaElement:
+        """Build the select used by the optional reads as a lambda statement.
+
+        SQLAlchemy caches lambda statements by the lambda code and closure
+        values, so the select is only constructed once per filter shape.
+        """
+        model = self.model
+        stmt = lambda_stmt(lambda: select(model))
+        for field, value in query_schema.model_dump(exclude_unset=True).items():
+            stmt = _where_equals(stmt, getattr(model, field), value)
+
+        return stmt + (lambda s: s.order_by(model.id))
+
+
     async def read_optional(
         self,
         query_schema: ReadOptionalSchemaType,
@@ -90,31 +121,52 @@ class SQLAlchemyRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType
         
         If values in query schema are not provided, they will default to None and
         will not be searched for. To search for None values specifically provide
-        desired value set to None.
+        desired value set to None. An empty list is returned when nothing matches.
         """
-        filters: dict = query_schema.model_dump(exclude_unset=True)
-        stmt = select(self.model).filter_by(**filters).order_by(self.model.id)
+        stmt = self._optional_stmt(query_schema)
 
-        res = await self.db.execute(stmt)
+        return (await self.db.execute(stmt)).scalars().all()
 
-        if not res.scalars().all():
-            CRUDSelectError(obj_id=self.model.id)
 
-        return self.model(res.scalars().all())
+    async def stream_optional(
+        self,
+        query_schema: ReadOptionalSchemaType,
+        chunk_size: int = 500,
+    ) -> AsyncIterator[Sequence[ModelType]]:
+        """Stream objects that match with query_schema in chunks of `chunk_size`.
+
+        Same filters as `read_optional`, but the rows are fetched with a server side
+        cursor, so large result sets are never fully materialized in memory.
+        """
+        stmt = self._optional_stmt(query_schema)
+
+        result = await self.db.stream_scalars(stmt, execution_options={"yield_per": chunk_size})
+        try:
+            async for partition in result.partitions():
+                yield partition
+        finally:
+            await result.close()
 
 
     async def delete(
         self,
         id: int,
     ) -> ModelType | None:
-        """Delete object from db by id or None if object not found in db"""
-        res = await self.db.get(self.model, id)
-        if res:
+        """Delete object from db by id or None if object not found in db.
 
-            await self.db.delete(res)
-            await self.db.commit()
+        A single `DELETE ... RETURNING` statement both deletes
+        and returns the object, which is then detached from the session.
+        """
+        stmt = delete(self.model).where(self.model.id == id).returning(self.model)
+        res = (await self.db.execute(stmt)).scalar_one_or_none()
+        await self.db.commit()
 
-            logger.info("Entitiy: {res} successfully deleted from database.")
+        if res:
+            # RETURNING puts the row back in the identity map, where
+            # `read_by_id` would still find it.
+            self.db.expunge(res)
+
+            logger.info(f"Entitiy: {res} successfully deleted from database.")
 
         else:
             logger.error(f"Object with id = {id} not found in query")
@@ -127,23 +179,28 @@ class SQLAlchemyRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType
         update_schema: UpdateSchemaType,
     ) -> ModelType:
         """
-        Update an object in the database by
-        ID or return None if the object is not found.
+        Update an object in the database by ID with a single
+        `UPDATE ... RETURNING` statement, or raise CRUDUpdateError
+        if the object is not found.
         """
-        db_obj = await self.db.get(self.model, id)
-        
-
-        if not db_obj:
-            raise CRUDUpdateError(obj_id=id)
+        values = update_schema.model_dump(exclude_unset=True)
+        if not values:
+            db_obj = await self.read_by_id(id)
+            if not db_obj:
+                raise CRUDUpdateError(obj_id=id)
+            return db_obj
+
+        stmt = update(self.model).where(self.model.id == id).values(**values).returning(self.model)
         try:
-            for field, value in update_schema.model_dump_json.items():
-                setattr(db_obj, field, value)
-            
+            db_obj = (await self.db.execute(stmt)).scalar_one_or_none()
             await self.db.commit()
-            
-            logger.info(f"Updated entity: {db_obj}.")
         except Exception as e:
             await self.db.rollback()
             raise CRUDUpdateError(obj_id=id, err=e)
-        
+
+        if not db_obj:
+            raise CRUDUpdateError(obj_id=id)
+
+        logger.info(f"Updated entity: {db_obj}.")
+
         return db_obj
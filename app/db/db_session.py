@@ -1,8 +1,12 @@
 """Connection to the Postgres database."""
+import asyncio
 import logging
-from sqlalchemy import MetaData
+from functools import lru_cache
+from uuid import uuid4
+from sqlalchemy import MetaData, text
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from app.config import get_api_settings 
 
@@ -10,13 +14,38 @@ logger = logging.getLogger(__name__)
 
 metadata = MetaData()
 
+@lru_cache(maxsize=1)
 def get_async_engine() -> AsyncEngine:
-    """Return async database engine."""
+    """Return the async database engine, created once and shared by the whole process."""
+    settings = get_api_settings()
+    if settings.use_pgbouncer:
+        # PgBouncer already pools the server connections, and in transaction
+        # mode prepared statements can't be cached across client connections.
+        # asyncpg names statements with a per-connection counter, which collides
+        # once PgBouncer shares a server connection, so each name is made unique.
+        pool_options = {
+            "poolclass": NullPool,
+            "connect_args": {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            },
+        }
+    else:
+        pool_options = {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout,
+            "pool_recycle": settings.db_pool_recycle,
+            "pool_pre_ping": True,
+        }
+
     try:
         async_engine: AsyncEngine = create_async_engine(
-            get_api_settings().database_url,
-            echo=True,
+            settings.database_url,
+            echo=False,
             future=True,
+            **pool_options,
         )
     except SQLAlchemyError as e:
         logger.warning("Unable to establish db engine, database might not exist yet")
@@ -25,15 +54,34 @@ def get_async_engine() -> AsyncEngine:
 
     return async_engine
 
-async def initialize_database() -> None:
+async def warm_pool(async_engine: AsyncEngine) -> None:
+    """
+    Open `db_pool_size` connections in parallel and return them to the pool,
+    so the first requests after startup don't pay for the connection handshake.
+    """
+    results = await asyncio.gather(
+        *(async_engine.connect() for _ in range(get_api_settings().db_pool_size)),
+        return_exceptions=True,
+    )
+    connections = [conn for conn in results if isinstance(conn, AsyncConnection)]
+    errors = [error for error in results if isinstance(error, BaseException)]
+    try:
+        if errors:
+            raise errors[0]
+        await asyncio.gather(*(conn.execute(text("SELECT 1")) for conn in connections))
+    finally:
+        await asyncio.gather(*(conn.close() for conn in connections))
+
+    logger.info(f"Warmed {len(connections)} database connections.")
+
+async def initialize_database(async_engine: AsyncEngine) -> None:
     """
     Initialize database.
-    Using the `reflect` method of metadata,
-    we can consume the entire base of a database,
-    and create its models based on these parameters
+    The models are declared in `app.db.models`, so there is no
+    schema introspection at startup, only the connection pool warm up,
+    which is skipped behind PgBouncer since there is no local pool.
     """
-    async_engine = get_async_engine()
-    async with async_engine.begin() as async_conn:
-        await async_conn.run_sync(metadata.reflect)
+    if not get_api_settings().use_pgbouncer:
+        await warm_pool(async_engine)
 
-        logger.info("Initializing database was successfull.")
+    logger.info("Initializing database was successfull.")
@@ -1,12 +1,15 @@
 
-from sqlalchemy import Table
-from app.db.base import SQLAlchemyRepository
-from db_session import metadata
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, Integer, String
+from app.db.base import Base, SQLAlchemyRepository
 
-Base = declarative_base(metadata=metadata)
+
+class User(Base):
+    __tablename__ = "users"
+
+    id = Column(Integer, primary_key=True)
+    username = Column(String, unique=True, nullable=False)
 
 
 class Users(SQLAlchemyRepository):
-    model = Table('users', metadata, autoload=True)
+    model = User
 
@@ -12,7 +12,7 @@ logger = logging.getLogger(__name__)
 
 
 class CRUDBaseError(HTTPException):
-    username: str
+    username: str = ""
 
     def __init__(self, status=status.HTTP_404_NOT_FOUND) -> None:
         super().__init__(
@@ -95,8 +95,8 @@ class CRUDSelectError(CRUDBaseError):
     """
 
     def __init__(self, *, obj_id, err=None) -> None:
-        super().__init__()
         self.obj_id = obj_id
+        super().__init__()
         logger.error(f"Error find object {obj_id} from {err}")
 
     def erro_message(self):
@@ -3,6 +3,7 @@
 TODO:
     1. do funcs need to be async?
 """
+from functools import lru_cache
 from typing import Callable, TypeVar, Type
 
 from fastapi import Depends
@@ -17,10 +18,15 @@ RepositoryType = TypeVar("RepositoryType", bound=SQLAlchemyRepository)
 
 
 # Repo dependency
+@lru_cache(maxsize=None)
 def get_repository(
     repo_type: Type[RepositoryType],
     ) -> Callable[[AsyncSession], Type[RepositoryType]]:
-    """Returns specified repository seeded with an async database session."""
+    """Returns specified repository seeded with an async database session.
+
+    The dependency is memoized per repository type, so every route using the
+    same repository shares one callable and one FastAPI dependency cache entry.
+    """
     def get_repo(
         db: AsyncSession = Depends(get_async_session),
         username: str = Depends(get_current_username),
@@ -6,23 +6,23 @@ TODO:
 import logging
 from typing import AsyncGenerator
 
+from fastapi import Request
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker
 
-from app.db.db_session import get_async_engine
-
 logger = logging.getLogger(__name__)
 
 # DB dependency
-async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+async def get_async_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """Yield an async session.
     
     All conversations with the database are established via the session
     objects. Also. the sessions act as holding zone for ORM-mapped objects.
+    The session is bound to the engine created in the app lifespan.
     """
     async_session = sessionmaker(
-        bind=get_async_engine(), 
+        bind=request.app.state.engine, 
         class_=AsyncSession, 
         autoflush=False,
         expire_on_commit=False,   # document this
@@ -0,0 +1,95 @@
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app import auth
+from app.auth import create_access_token, get_current_username
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    auth._token_cache.clear()
+    yield
+    auth._token_cache.clear()
+
+
+@pytest.fixture
+def count_decode(monkeypatch):
+    calls = []
+    decode = auth.jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return decode(*args, **kwargs)
+
+    monkeypatch.setattr(auth.jwt, "decode", counting_decode)
+    return calls
+
+
+def test_get_current_username():
+    token = create_access_token({"sub": "john_doe"})
+
+    assert get_current_username(token) == "john_doe"
+
+
+def test_get_current_username_uses_cache(count_decode):
+    token = create_access_token({"sub": "john_doe"})
+
+    assert get_current_username(token) == "john_doe"
+    assert get_current_username(token) == "john_doe"
+    assert len(count_decode) == 1
+
+
+def test_invalid_token_is_not_cached(count_decode):
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc:
+            get_current_username("invalid-token")
+        assert exc.value.status_code == 401
+
+    assert len(count_decode) == 2
+    assert len(auth._token_cache) == 0
+
+
+def test_expired_token():
+    token = create_access_token({"sub": "john_doe"}, expires_delta=timedelta(minutes=-1))
+
+    with pytest.raises(HTTPException) as exc:
+        get_current_username(token)
+
+    assert exc.value.detail == "Token expired"
+
+
+def test_reload_auth_settings(monkeypatch):
+    token = create_access_token({"sub": "john_doe"})
+    monkeypatch.setenv("SECRET_KEY", "another-secret")
+    auth.reload_auth_settings()
+
+    try:
+        with pytest.raises(HTTPException) as exc:
+            get_current_username(token)
+        assert exc.value.status_code == 401
+    finally:
+        monkeypatch.undo()
+        auth.reload_auth_settings()
+
+
+@pytest.mark.parametrize("data", [{}, {"sub": ""}, {"sub": None}])
+def test_token_without_username(data):
+    token = create_access_token(data)
+
+    with pytest.raises(HTTPException) as exc:
+        get_current_username(token)
+
+    assert exc.value.detail == "Could not validate credentials"
+
+
+def test_rejections_do_not_share_exception_context():
+    with pytest.raises(HTTPException) as invalid:
+        get_current_username("invalid-token")
+
+    with pytest.raises(HTTPException) as missing_sub:
+        get_current_username(create_access_token({}))
+
+    assert invalid.value is not missing_sub.value
+    assert missing_sub.value.__context__ is None
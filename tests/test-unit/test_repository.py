@@ -0,0 +1,45 @@
+import pytest
+from pydantic import BaseModel
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.db.models import User, Users
+
+
+class UserQuery(BaseModel):
+    id: int | None = None
+    username: str | None = None
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([User(id=1, username="x"), User(id=2, username="y")])
+        session.commit()
+        yield session
+
+
+def read_optional(db, query):
+    stmt = Users(db=db, username="john_doe")._optional_stmt(query)
+    return [user.username for user in db.execute(stmt).scalars()]
+
+
+def test_optional_stmt_binds_each_value(db):
+    assert read_optional(db, UserQuery(username="x")) == ["x"]
+    assert read_optional(db, UserQuery(username="y")) == ["y"]
+
+
+def test_optional_stmt_binds_each_filter(db):
+    assert read_optional(db, UserQuery(id=2, username="y")) == ["y"]
+    assert read_optional(db, UserQuery(id=1, username="y")) == []
+
+
+def test_optional_stmt_none_filter(db):
+    stmt = Users(db=db, username="john_doe")._optional_stmt(UserQuery(username=None))
+
+    assert "users.username IS NULL" in str(stmt.compile(db.bind))
+    assert read_optional(db, UserQuery(username=None)) == []
+    assert read_optional(db, UserQuery()) == ["x", "y"]